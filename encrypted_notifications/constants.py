@@ -1,12 +1,22 @@
 from dotenv import load_dotenv
+from functools import lru_cache
 import os
 
-load_dotenv()
 
 # ---------- element credentials ---------- #
-USERNAME = os.getenv("USERNAME")
-PASSWORD = os.getenv("PASSWORD")
-ROOM_ID = os.getenv("ROOM_ID")
+@lru_cache(maxsize=1)
+def _env() -> dict:
+    # parse .env once per process, and only when credentials are first accessed
+    load_dotenv()
+    return {key: os.getenv(key) for key in ("USERNAME", "PASSWORD", "ROOM_ID")}
+
+
+def __getattr__(name: str):
+    # PEP 562: resolve credentials lazily so importing the module pays nothing
+    if name in ("USERNAME", "PASSWORD", "ROOM_ID"):
+        return _env()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------- file names ---------- #
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
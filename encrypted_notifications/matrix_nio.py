@@ -9,16 +9,30 @@ from .constants import (
     MatrixLoginError
 )
 from logs.logger_helper import LoggerHelper
+import asyncio
 import os
 import json
 import logging
-from typing import Optional, Tuple
+
+try:
+    # faster (de)serialization for the credentials file; operates on bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+from typing import List, Optional, Tuple
 # 'nio' module is provided by the 'matrix-nio' package
 from nio import AsyncClient, LoginResponse
 
 # suppress all warnings except critical
 logging.getLogger("nio").setLevel(logging.CRITICAL)
 
+# parsed credentials keyed by file path, invalidated when the file's mtime changes
+_CREDS_CACHE: dict = {}
+
+# initialized clients keyed by (homeserver, username, store_path) so the expensive
+# store load + full-state sync only happens once per account per process
+_CLIENT_CACHE: dict = {}
+
 
 class MatrixNio:
     """
@@ -71,13 +85,22 @@ class MatrixNio:
 
         This method must be called before attempting to send messages.
         """
-        access_token, device_id, user_id = self.load_credentials()
+        key = (self.homeserver, self.username, self.store_path)
+        cached = _CLIENT_CACHE.get(key)
+        if cached is not None:  # reuse the already-synced client, only catching up incrementally
+            self.client = cached
+            await self.client.sync(since=self.client.next_batch, full_state=False)
+            return
+
+        access_token, device_id, user_id, next_batch = await self.load_credentials()
         self.initialize_client(access_token, device_id, user_id)
 
         if not self.client.access_token:  # check if we need to log in
             await self.login()
+            next_batch = None  # fresh login: the stored token (if any) belongs to the old session
 
-        await self.load_and_sync_client()
+        await self.load_and_sync_client(next_batch)
+        _CLIENT_CACHE[key] = self.client
 
     def initialize_client(self, access_token: Optional[str] = None, device_id: Optional[str] = None, user_id: Optional[str] = None):
         """
@@ -108,26 +131,44 @@ class MatrixNio:
             self.client.device_id = response.device_id
             self.client.user_id = response.user_id
 
-            self.save_credentials(  # save credentials for future use
-                access_token=response.access_token,
-                device_id=response.device_id,
-                user_id=response.user_id,
+            await asyncio.gather(  # save credentials for future use while the key upload is in flight
+                self.save_credentials(
+                    access_token=response.access_token,
+                    device_id=response.device_id,
+                    user_id=response.user_id,
+                ),
+                self.client.keys_upload(),  # upload encryption keys after login
             )
 
-            await self.client.keys_upload()  # upload encryption keys after login
-
-            self.logger.info(f"Logged in as {self.client.user_id} on device {self.client.device_id}")
+            self.logger.info("Logged in as %s on device %s", self.client.user_id, self.client.device_id)
             self.logger.info("Please verify this device in your Matrix client to enable encrypted messaging.")
         else:
-            self.logger.error(f"Login failed: {response}")
+            self.logger.error("Login failed: %s", response)
             raise MatrixLoginError
 
-    async def load_and_sync_client(self):
+    async def load_and_sync_client(self, since: Optional[str] = None):
         """
         Loads the store and performs an initial sync to fetch encryption keys and device lists.
+
+        When a `since` token from a previous run is available, only the changes since that
+        sync are fetched instead of downloading the full room state again.
+
+        :param since: The `next_batch` token persisted by a previous sync, if any.
         """
         self.client.load_store()
-        await self.client.sync(full_state=True)
+
+        if since:
+            await self.client.sync(since=since, full_state=False, timeout=0)
+        else:
+            await self.client.sync(full_state=True)
+
+        if self.client.access_token:  # persist the new token so the next start can sync incrementally
+            await self.save_credentials(
+                access_token=self.client.access_token,
+                device_id=self.client.device_id,
+                user_id=self.client.user_id,
+                next_batch=self.client.next_batch,
+            )
 
     async def send_message(self, message: str):
         """
@@ -144,44 +185,84 @@ class MatrixNio:
             },
             ignore_unverified_devices=True,
         )
-        self.logger.info(f"Sent message to Matrix Room: {message}")
+        if self.logger.isEnabledFor(logging.INFO):  # skip formatting the payload when INFO is filtered out
+            self.logger.info("Sent message to Matrix Room: %s", message)
+
+    async def send_many(self, messages: List[str]):
+        """
+        Sends multiple messages to the room as a single encrypted message.
+
+        The messages are joined with newlines and sent in one `room_send`, so N notifications
+        cost one HTTPS round-trip instead of N.
+
+        :param messages: The list of message contents to send, in order.
+        """
+        if not messages:
+            return
+
+        await self.send_message("\n".join(messages))
 
     async def close(self):
         """
         Closes the MatrixNio client session and releases any held resources.
         """
+        # drop the shared client so later starts build a fresh one instead of reusing a closed session
+        _CLIENT_CACHE.pop((self.homeserver, self.username, self.store_path), None)
         await self.client.close()
 
-    def load_credentials(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    async def load_credentials(self) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
         """
         Loads stored credentials from the credentials file if it exists.
 
-        :return: A tuple containing (access_token, device_id, user_id), or (None, None, None) if not found.
+        The blocking file I/O runs in a worker thread so the event loop is not stalled.
+
+        :return: A tuple containing (access_token, device_id, user_id, next_batch),
+                 or (None, None, None, None) if not found.
         """
+        return await asyncio.to_thread(self._load_credentials_sync)
+
+    def _load_credentials_sync(self) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
         os.makedirs(self.store_path, exist_ok=True)
 
         if os.path.exists(self.credentials_file):
-            with open(self.credentials_file, "r") as f:
-                creds = json.load(f)
+            mtime = os.stat(self.credentials_file).st_mtime_ns
+
+            cached = _CREDS_CACHE.get(self.credentials_file)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            with open(self.credentials_file, "rb") as f:
+                data = f.read()
+                creds = orjson.loads(data) if orjson is not None else json.loads(data)
                 access_token = creds.get("access_token")
                 device_id = creds.get("device_id")
                 user_id = creds.get("user_id")
-                return access_token, device_id, user_id
+                next_batch = creds.get("next_batch")
+
+                _CREDS_CACHE[self.credentials_file] = (mtime, (access_token, device_id, user_id, next_batch))
+                return access_token, device_id, user_id, next_batch
         else:
-            return None, None, None
+            return None, None, None, None
 
-    def save_credentials(self, access_token: str, device_id: str, user_id: str):
+    async def save_credentials(self, access_token: str, device_id: str, user_id: str, next_batch: Optional[str] = None):
         """
         Saves credentials to the credentials file for future use.
 
+        The blocking file I/O runs in a worker thread so the event loop is not stalled.
+
         :param access_token: The access token obtained after logging in.
         :param device_id: The device ID assigned by the homeserver.
         :param user_id: The user ID associated with the account.
+        :param next_batch: The sync token from the latest sync, enabling incremental syncs on restart.
         """
+        await asyncio.to_thread(self._save_credentials_sync, access_token, device_id, user_id, next_batch)
+
+    def _save_credentials_sync(self, access_token: str, device_id: str, user_id: str, next_batch: Optional[str] = None):
         creds = {
             "access_token": access_token,
             "device_id": device_id,
             "user_id": user_id,
+            "next_batch": next_batch,
         }
-        with open(self.credentials_file, "w") as f:
-            json.dump(creds, f)
+        with open(self.credentials_file, "wb") as f:
+            f.write(orjson.dumps(creds) if orjson is not None else json.dumps(creds).encode())
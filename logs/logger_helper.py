@@ -1,26 +1,75 @@
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
+# memoized loggers so repeated lookups skip the handler setup
+_LOGGER_CACHE: dict[tuple[str, str], logging.Logger] = {}
+
+# the format string is constant, so parse it once at import time
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# one timestamp per process, so every logger in a run shares one log file per source
+_RUN_STAMP = datetime.now().strftime('%Y%m%d%H%M%S')
+
+# background listeners owning the file handlers, kept alive for the process lifetime
+# and keyed like _LOGGER_CACHE so every logger's listener stays reachable
+_LISTENERS: dict[tuple[str, str], QueueListener] = {}
+
+# directories already created this process, so construction never repeats the syscall
+_INITIALIZED: set[str] = set()
+
+
+def _ensure_dir(path: str):
+    if path not in _INITIALIZED:
+        os.makedirs(path, exist_ok=True)
+        _INITIALIZED.add(path)
+
 
 class LoggerHelper:
+    # resolved (file_name, file_path) per `file` argument, so repeat construction
+    # is a dict hit instead of four path/stat operations
+    _PATH_CACHE: dict[str, tuple[str, str]] = {}
+
     def __init__(self, file: str):
+        cached = self._PATH_CACHE.get(file)
+        if cached is not None:
+            self.file_name, self.file_path = cached
+            return
+
         self.file_name = os.path.basename(os.path.dirname(os.path.abspath(file)))
         self.file_path = f"{str(Path(__file__).resolve()).split('/.venv')[0]}/log_output"
 
-        if not os.path.exists(self.file_path):
-            os.makedirs(self.file_path, exist_ok=True)
+        _ensure_dir(self.file_path)
+        self._PATH_CACHE[file] = (self.file_name, self.file_path)
 
     def get_logger(self, name: str) -> logging.Logger:
+        key = (self.file_path, name)
+        cached = _LOGGER_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         logger = logging.getLogger(name)
         logger.setLevel(logging.INFO)
 
         if not logger.hasHandlers():
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            file_handler = logging.FileHandler(f"{self.file_path}/{self.file_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}.log")
-            file_handler.setFormatter(formatter)
+            log_file = f"{self.file_path}/{self.file_name}_{_RUN_STAMP}.log"
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(_FORMATTER)
+
+            # emit to an in-memory queue; a background thread drains it to the file
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
 
-            logger.addHandler(file_handler)
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            # flush queued records at interpreter exit; this runs before logging's
+            # own shutdown hook closes the file handler
+            atexit.register(listener.stop)
+            _LISTENERS[key] = listener
 
+        _LOGGER_CACHE[key] = logger
         return logger
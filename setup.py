@@ -1,9 +1,11 @@
 from setuptools import setup, find_packages
+from functools import lru_cache
+from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def parse_requirements():
-    with open("requirements.txt", "r") as requirements:
-        return requirements.read().splitlines()
+    return Path("requirements.txt").read_text().splitlines()
 
 
 setup(